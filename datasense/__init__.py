@@ -28,16 +28,216 @@ Why this?
 
 __version__ = "0.9.1"
 
+import importlib
 
-from .stats import *
-from .control_charts import *
-from .msa import *
-from .munging import *
-from .graphs import *
-from .html_ds import *
-from .pyxl import *
-from .sequel import *
-from .rgx import *
-from .automation import *
-from .taguchi import *
-from .process_capability import *
+# The __all__ of each submodule, in the order they were once star-imported;
+# tests/test_init.py checks this against the submodules. Submodules load on
+# first attribute access (PEP 562) so that, for example,
+# fahrenheit_to_celsius_table does not pay for matplotlib or scikit-learn.
+_SUBMODULES: dict[str, tuple[str, ...]] = {
+    "stats": (
+        "nonparametric_summary",
+        "natural_cubic_spline",
+        "parametric_summary",
+        "linear_regression",
+        "timedelta_data",
+        "datetime_data",
+        "cubic_spline",
+        "two_sample_t",
+        "one_sample_t",
+        "random_data",
+        "quantiles",
+        "paired_t",
+    ),
+    "control_charts": (
+        "ControlChart",
+        "points_three",
+        "points_four",
+        "points_two",
+        "points_one",
+        "draw_rules",
+        "draw_rule",
+        "Xbar",
+        "mR",
+        "R",
+        "X",
+    ),
+    "msa": (
+        "MSA",
+    ),
+    "munging": (
+        "listone_contains_all_listtwo_substrings",
+        "number_empty_cells_in_columns",
+        "convert_seconds_to_hh_mm_ss",
+        "parameters_dict_replacement",
+        "parameters_text_replacement",
+        "ask_save_as_file_name_path",
+        "optimize_datetime_columns",
+        "optimize_integer_columns",
+        "print_dictionary_by_key",
+        "optimize_object_columns",
+        "ask_open_file_name_path",
+        "convert_csv_to_feather",
+        "find_int_float_columns",
+        "find_timedelta_columns",
+        "optimize_float_columns",
+        "create_dataframe_norm",
+        "replace_column_values",
+        "feature_percent_empty",
+        "find_category_columns",
+        "find_datetime_columns",
+        "list_one_list_two_ops",
+        "series_replace_string",
+        "delete_empty_columns",
+        "directory_file_print",
+        "replace_text_numbers",
+        "find_integer_columns",
+        "find_object_columns",
+        "rename_some_columns",
+        "series_memory_usage",
+        "ask_directory_path",
+        "rename_all_columns",
+        "find_float_columns",
+        "remove_punctuation",
+        "print_list_by_item",
+        "delete_empty_rows",
+        "delete_list_files",
+        "find_bool_columns",
+        "create_dataframe",
+        "create_directory",
+        "delete_directory",
+        "list_change_case",
+        "list_directories",
+        "optimize_columns",
+        "rename_directory",
+        "process_columns",
+        "copy_directory",
+        "dataframe_info",
+        "delete_columns",
+        "quit_sap_excel",
+        "mask_outliers",
+        "process_rows",
+        "delete_rows",
+        "list_files",
+        "byte_size",
+        "get_mtime",
+        "file_size",
+        "read_file",
+        "save_file",
+        "sort_rows",
+    ),
+    "graphs": (
+        "plot_scatterleft_scatterright_x_y1_y2",
+        "plot_scatter_scatter_x1_x2_y1_y2",
+        "plot_lineleft_lineright_x_y1_y2",
+        "plot_barleft_lineright_x_y1_y2",
+        "plot_line_line_line_x_y1_y2_y3",
+        "plot_scatter_scatter_x_y1_y2",
+        "plot_scatter_line_x_y1_y2",
+        "plot_line_line_x_y1_y2",
+        "plot_horizontal_bars",
+        "plot_line_line_y1_y2",
+        "plot_vertical_bars",
+        "plot_stacked_bars",
+        "probability_plot",
+        "plot_scatter_x_y",
+        "plot_histogram",
+        "plot_scatter_y",
+        "empirical_cdf",
+        "plot_line_x_y",
+        "format_dates",
+        "plot_boxplot",
+        "plot_boxcox",
+        "plot_line_y",
+        "plot_pareto",
+        "style_graph",
+        "dd_to_dms",
+        "dms_to_dd",
+        "waterfall",
+        "plot_pie",
+        "despine",
+        "qr_code",
+    ),
+    "html_ds": (
+        "explore_functions",
+        "sync_directories",
+        "report_summary",
+        "script_summary",
+        "html_figure",
+        "html_footer",
+        "html_header",
+        "html_begin",
+        "page_break",
+        "html_end",
+    ),
+    "pyxl": (
+        "list_empty_except_nan_worksheet_rows",
+        "list_empty_and_nan_worksheet_rows",
+        "list_duplicate_worksheet_rows",
+        "change_case_worksheet_columns",
+        "write_dataframe_to_worksheet",
+        "remove_empty_worksheet_rows",
+        "remove_worksheet_columns",
+        "list_nan_worksheet_rows",
+        "list_rows_with_content",
+        "validate_column_labels",
+        "number_non_empty_rows",
+        "remove_worksheet_rows",
+        "validate_sheet_names",
+        "autofit_column_width",
+        "unique_list_items",
+        "cell_fill_down",
+        "read_workbook",
+        "replace_text",
+        "exit_script",
+        "cell_style",
+    ),
+    "sequel": (
+        "psycopg2_connection",
+    ),
+    "rgx": (
+        "rgx_email_address",
+        "rgx_url",
+    ),
+    "automation": (
+        "fahrenheit_to_celsius_table",
+        "water_coffee_tea_milk",
+    ),
+    "taguchi": (
+        "taguchi_loss_function",
+    ),
+    "process_capability": (
+        "cp",
+        "cpk",
+        "cpm",
+        "pp",
+        "ppk",
+    ),
+}
+_LAZY: dict[str, str] = {
+    name: f"{__name__}.{module}"
+    for module, names in _SUBMODULES.items()
+    for name in names
+}
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import the submodule that defines name and cache the attribute.
+    """
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
@@ -2,8 +2,6 @@
 Automation functions
 """
 
-from datasense import convert_seconds_to_hh_mm_ss
-
 
 def fahrenheit_to_celsius_table(
     min_fahrenheit: int = 350,
@@ -49,13 +47,13 @@ def fahrenheit_to_celsius_table(
     ...     output_url=output_url
     ... )
     """
-    html_table = """
+    html_rows = ["""
     <table>
       <tr>
         <th>Fahrenheit</th>
         <th>Celsius</th>
       </tr>
-    """
+    """]
     for fahrenheit in range(
         min_fahrenheit,
         max_fahrenheit + fahrenheit_increment,
@@ -65,15 +63,16 @@ def fahrenheit_to_celsius_table(
             rounding_increment *
             round(((fahrenheit - 32) * 5 / 9) / rounding_increment)
         )
-        html_table += """
+        html_rows.append("""
         <tr>
           <td>{}</td>
           <td>{}</td>
         </tr>
-        """.format(fahrenheit, celsius)
-    html_table += """
+        """.format(fahrenheit, celsius))
+    html_rows.append("""
     </table>
-    """
+    """)
+    html_table = "".join(html_rows)
     return html_table
 
 
@@ -166,6 +165,9 @@ def water_coffee_tea_milk(
     >>> print(all_coffee_water)
     (370, 220, 150)
     """
+    # munging pulls in pandas, scipy, and pyarrow; import it only when needed
+    from datasense import convert_seconds_to_hh_mm_ss
+
     coffee_mug_water = mugs_coffee * water_coffee_mass
     coffee_filter_water = mugs_coffee * water_coffee_filter_mass
     tea_cup_water = cups_tea * water_tea_cup_mass
@@ -5,13 +5,12 @@ Create X, mR, Xbar, R control charts
 Invoke Shewhart rules 1, 2, 3, 4
 """
 
-from typing import Iterable, TypeVar
+from functools import cached_property
 from collections import defaultdict
 from abc import ABC, abstractmethod
-from itertools import tee
 from math import sqrt
 
-from cached_property import cached_property
+from numpy.lib.stride_tricks import sliding_window_view
 import matplotlib.pyplot as plt
 import matplotlib.axes as axes
 import pandas as pd
@@ -23,78 +22,120 @@ colour2 = '#33bbee'
 colour3 = '#009988'
 colour4 = '#cc3311'
 
-CONSTANTS: pd.DataFrame = pd.DataFrame.from_dict(
-    dict(
-        n=np.array([
-            2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19,
-            20, 21, 22, 23, 24, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75,
-            80, 85, 90, 100]),
-        A2=np.array([
-            1.881, 1.023, 0.729, 0.577, 0.483, 0.419, 0.373, 0.337, 0.308,
-            0.285, 0.266, 0.249, 0.235, 0.223, 0.212, 0.203, 0.194, 0.187,
-            0.180, 0.173, 0.167, 0.162, 0.157, 0.153, 0.134, 0.120, 0.110,
-            0.101, 0.094, 0.088, 0.083, 0.079, 0.075, 0.072, 0.069, 0.066,
-            0.064, 0.060]),
-        A3=np.array([
-            2.659, 1.954, 1.628, 1.427, 1.287, 1.182, 1.099, 1.032, 0.975,
-            0.927, 0.886, 0.850, 0.817, 0.789, 0.763, 0.739, 0.718, 0.698,
-            0.680, 0.663, 0.647, 0.633, 0.619, 0.606]),
-        B3=np.array([
-            0, 0, 0, 0, 0.030, 0.118, 0.185, 0.239, 0.284, 0.321, 0.354,
-            0.382, 0.406, 0.428, 0.448, 0.466, 0.482, 0.497, 0.510, 0.523,
-            0.534, 0.545, 0.555, 0.565]),
-        B4=np.array([
-            3.267, 2.568, 2.266, 2.089, 1.970, 1.882, 1.815, 1.761, 1.716,
-            1.679, 1.646, 1.618, 1.594, 1.572, 1.552, 1.534, 1.518, 1.503,
-            1.490, 1.477, 1.466, 1.455, 1.445, 1.435]),
-        c2=np.array([
-            0.5642, 0.7236, 0.7979, 0.8407, 0.8686, 0.8882, 0.9027, 0.9139,
-            0.9227, 0.9300, 0.9359, 0.9410, 0.9453, 0.9490, 0.9523, 0.9551,
-            0.9576, 0.9599, 0.9619, 0.9638, 0.9655, 0.9670, 0.9684, 0.9695,
-            0.9748, 0.9784, 0.9811, 0.9832, 0.9849, 0.9863, 0.9874, 0.9884,
-            0.9892, 0.9900, 0.9906, 0.9911, 0.9916, 0.9925]),
-        c4=np.array([
-            0.7979, 0.8862, 0.9213, 0.9400, 0.9515, 0.9594, 0.9650, 0.9693,
-            0.9727, 0.9754, 0.9776, 0.9794, 0.9810, 0.9823, 0.9835, 0.9845,
-            0.9854, 0.9862, 0.9869, 0.9876, 0.9882, 0.9887, 0.9892, 0.9896]),
-        d2=np.array([
-            1.128, 1.693, 2.059, 2.326, 2.534, 2.704, 2.847, 2.970, 3.078,
-            3.173, 3.258, 3.336, 3.407, 3.472, 3.532, 3.588, 3.640, 3.689,
-            3.735, 3.778, 3.819, 3.858, 3.895, 3.931, 4.086, 4.213, 4.322,
-            4.415, 4.498, 4.572, 4.639, 4.699, 4.755, 4.806, 4.854, 4.898,
-            4.939, 5.015]),
-        d3=np.array([
-            0.8525, 0.8884, 0.8798, 0.8641, 0.8480, 0.8332, 0.8198, 0.8078,
-            0.7971, 0.7873, 0.7785, 0.7704, 0.7630, 0.7562, 0.7499, 0.7441,
-            0.7386, 0.7335, 0.7287, 0.7272, 0.7199, 0.7159, 0.7121, 0.7084,
-            0.6927, 0.6799, 0.6692, 0.6601, 0.6521, 0.6452, 0.6389, 0.6333,
-            0.6283, 0.6236, 0.6194, 0.6154, 0.6118, 0.6052]),
-        D3=np.array([
-            'NaN', 'NaN', 'NaN', 'NaN', 'NaN', 0.076, 0.136, 0.184, 0.223,
-            0.256, 0.283, 0.307, 0.328, 0.347, 0.363, 0.378, 0.391, 0.403,
-            0.415, 0.423, 0.434, 0.443, 0.452, 0.459, 0.491, 0.516, 0.535,
-            0.551, 0.565, 0.577, 0.587, 0.596, 0.604, 0.611, 0.617, 0.623,
-            0.628, 0.638]),
-        d4=np.array([
-            0.954, 1.588, 1.978, 2.257, 2.472, 2.645, 2.791, 2.915, 3.024,
-            3.121, 3.207, 3.285, 3.356, 3.422, 3.482, 3.538, 3.591, 3.640,
-            3.686, 3.730, 3.771, 3.811, 3.847, 3.883, 4.037, 4.166, 4.274,
-            4.372, 4.450, 4.521, 4.591, 4.649, 4.707, 4.757, 4.806, 4.849,
-            4.892, 4.968]),
-        D4=np.array([
-            3.267, 2.574, 2.282, 2.114, 2.004, 1.924, 1.864, 1.816, 1.777,
-            1.744, 1.717, 1.693, 1.672, 1.653, 1.637, 1.622, 1.609, 1.597,
-            1.585, 1.577, 1.566, 1.557, 1.548, 1.541, 1.509, 1.484, 1.465,
-            1.449, 1.435, 1.423, 1.413, 1.404, 1.396, 1.389, 1.383, 1.377,
-            1.372, 1.362]),
-        E2=np.array([
-            2.660, 1.772, 1.457, 1.290, 1.184, 1.109, 1.054, 1.010, 0.975,
-            0.945, 0.921, 0.899, 0.881, 0.864, 0.849, 0.836, 0.824, 0.813,
-            0.803, 0.794, 0.786, 0.778, 0.770, 0.763, 0.734, 0.712, 0.694,
-            0.680, 0.667, 0.656, 0.647, 0.638, 0.631, 0.624, 0.618, 0.612,
-            0.607, 0.598])
-    ),
-    orient='index').transpose().set_index('n')
+# Columns are shorter than n where a constant is not tabulated for large n.
+_TABLE: dict[str, np.ndarray] = dict(
+    n=np.array([
+        2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19,
+        20, 21, 22, 23, 24, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75,
+        80, 85, 90, 100]),
+    A2=np.array([
+        1.881, 1.023, 0.729, 0.577, 0.483, 0.419, 0.373, 0.337, 0.308,
+        0.285, 0.266, 0.249, 0.235, 0.223, 0.212, 0.203, 0.194, 0.187,
+        0.180, 0.173, 0.167, 0.162, 0.157, 0.153, 0.134, 0.120, 0.110,
+        0.101, 0.094, 0.088, 0.083, 0.079, 0.075, 0.072, 0.069, 0.066,
+        0.064, 0.060]),
+    A3=np.array([
+        2.659, 1.954, 1.628, 1.427, 1.287, 1.182, 1.099, 1.032, 0.975,
+        0.927, 0.886, 0.850, 0.817, 0.789, 0.763, 0.739, 0.718, 0.698,
+        0.680, 0.663, 0.647, 0.633, 0.619, 0.606]),
+    B3=np.array([
+        0, 0, 0, 0, 0.030, 0.118, 0.185, 0.239, 0.284, 0.321, 0.354,
+        0.382, 0.406, 0.428, 0.448, 0.466, 0.482, 0.497, 0.510, 0.523,
+        0.534, 0.545, 0.555, 0.565]),
+    B4=np.array([
+        3.267, 2.568, 2.266, 2.089, 1.970, 1.882, 1.815, 1.761, 1.716,
+        1.679, 1.646, 1.618, 1.594, 1.572, 1.552, 1.534, 1.518, 1.503,
+        1.490, 1.477, 1.466, 1.455, 1.445, 1.435]),
+    c2=np.array([
+        0.5642, 0.7236, 0.7979, 0.8407, 0.8686, 0.8882, 0.9027, 0.9139,
+        0.9227, 0.9300, 0.9359, 0.9410, 0.9453, 0.9490, 0.9523, 0.9551,
+        0.9576, 0.9599, 0.9619, 0.9638, 0.9655, 0.9670, 0.9684, 0.9695,
+        0.9748, 0.9784, 0.9811, 0.9832, 0.9849, 0.9863, 0.9874, 0.9884,
+        0.9892, 0.9900, 0.9906, 0.9911, 0.9916, 0.9925]),
+    c4=np.array([
+        0.7979, 0.8862, 0.9213, 0.9400, 0.9515, 0.9594, 0.9650, 0.9693,
+        0.9727, 0.9754, 0.9776, 0.9794, 0.9810, 0.9823, 0.9835, 0.9845,
+        0.9854, 0.9862, 0.9869, 0.9876, 0.9882, 0.9887, 0.9892, 0.9896]),
+    d2=np.array([
+        1.128, 1.693, 2.059, 2.326, 2.534, 2.704, 2.847, 2.970, 3.078,
+        3.173, 3.258, 3.336, 3.407, 3.472, 3.532, 3.588, 3.640, 3.689,
+        3.735, 3.778, 3.819, 3.858, 3.895, 3.931, 4.086, 4.213, 4.322,
+        4.415, 4.498, 4.572, 4.639, 4.699, 4.755, 4.806, 4.854, 4.898,
+        4.939, 5.015]),
+    d3=np.array([
+        0.8525, 0.8884, 0.8798, 0.8641, 0.8480, 0.8332, 0.8198, 0.8078,
+        0.7971, 0.7873, 0.7785, 0.7704, 0.7630, 0.7562, 0.7499, 0.7441,
+        0.7386, 0.7335, 0.7287, 0.7272, 0.7199, 0.7159, 0.7121, 0.7084,
+        0.6927, 0.6799, 0.6692, 0.6601, 0.6521, 0.6452, 0.6389, 0.6333,
+        0.6283, 0.6236, 0.6194, 0.6154, 0.6118, 0.6052]),
+    D3=np.array([
+        np.nan, np.nan, np.nan, np.nan, np.nan, 0.076, 0.136, 0.184, 0.223,
+        0.256, 0.283, 0.307, 0.328, 0.347, 0.363, 0.378, 0.391, 0.403,
+        0.415, 0.423, 0.434, 0.443, 0.452, 0.459, 0.491, 0.516, 0.535,
+        0.551, 0.565, 0.577, 0.587, 0.596, 0.604, 0.611, 0.617, 0.623,
+        0.628, 0.638]),
+    d4=np.array([
+        0.954, 1.588, 1.978, 2.257, 2.472, 2.645, 2.791, 2.915, 3.024,
+        3.121, 3.207, 3.285, 3.356, 3.422, 3.482, 3.538, 3.591, 3.640,
+        3.686, 3.730, 3.771, 3.811, 3.847, 3.883, 4.037, 4.166, 4.274,
+        4.372, 4.450, 4.521, 4.591, 4.649, 4.707, 4.757, 4.806, 4.849,
+        4.892, 4.968]),
+    D4=np.array([
+        3.267, 2.574, 2.282, 2.114, 2.004, 1.924, 1.864, 1.816, 1.777,
+        1.744, 1.717, 1.693, 1.672, 1.653, 1.637, 1.622, 1.609, 1.597,
+        1.585, 1.577, 1.566, 1.557, 1.548, 1.541, 1.509, 1.484, 1.465,
+        1.449, 1.435, 1.423, 1.413, 1.404, 1.396, 1.389, 1.383, 1.377,
+        1.372, 1.362]),
+    E2=np.array([
+        2.660, 1.772, 1.457, 1.290, 1.184, 1.109, 1.054, 1.010, 0.975,
+        0.945, 0.921, 0.899, 0.881, 0.864, 0.849, 0.836, 0.824, 0.813,
+        0.803, 0.794, 0.786, 0.778, 0.770, 0.763, 0.734, 0.712, 0.694,
+        0.680, 0.667, 0.656, 0.647, 0.638, 0.631, 0.624, 0.618, 0.612,
+        0.607, 0.598])
+)
+
+CONSTANTS: pd.DataFrame = pd.DataFrame(
+    data={
+        column: np.pad(
+            values.astype(np.float64),
+            pad_width=(0, _TABLE['n'].size - values.size),
+            constant_values=np.nan
+        )
+        for column, values in _TABLE.items()
+        if column != 'n'
+    },
+    index=pd.Index(_TABLE['n'], name='n')
+)
+
+# Plain lookup table, CONSTANTS[column].loc[n] without the pandas overhead.
+_CONSTANTS: dict[str, dict[int, float]] = {
+    column: {int(n): value for n, value in CONSTANTS[column].items()}
+    for column in CONSTANTS.columns
+}
+
+
+def _constant(column: str, n: int) -> float:
+    """
+    Look up a control chart constant.
+
+    Parameters
+    ----------
+    column : str
+        The name of the constant, a column of CONSTANTS.
+    n : int
+        The subgroup size, a row of CONSTANTS.
+
+    Returns
+    -------
+    float
+        The value of the constant.
+    """
+    try:
+        return _CONSTANTS[column][n]
+    except KeyError:
+        raise ValueError(
+            f'no control chart constant {column} for subgroup size {n}'
+        ) from None
 
 
 def _despine(ax: axes.Axes) -> None:
@@ -112,23 +153,64 @@ def _despine(ax: axes.Axes) -> None:
         ax.spines[spine].set_visible(False)
 
 
+def _moving_ranges(values: np.ndarray, subgroup_size: int) -> np.ndarray:
+    """
+    Calculate the moving ranges of consecutive values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The individual values.
+    subgroup_size : int
+        The number of consecutive values in each moving range.
+
+    Returns
+    -------
+    np.ndarray
+        The moving ranges, one per complete window of subgroup_size values.
+    """
+    if values.size < subgroup_size:
+        return np.empty(shape=0)
+    if subgroup_size == 2:
+        return np.abs(np.diff(values))
+    windows = sliding_window_view(values, subgroup_size)
+    return windows.max(axis=1) - windows.min(axis=1)
+
+
 class Sigmas:
+    __slots__ = ('_mean', '_sigma', '_levels')
+
     def __init__(self, mean: float, sigma: float):
         self._mean = mean
         self._sigma = sigma
+        # The -3 to +3 sigma levels drawn on a chart, indexed by level + 3.
+        self._levels = mean + np.arange(-3, 4) * sigma
 
-    def __getitem__(self, index: int | slice) -> float:
+    def __getitem__(
+        self,
+        index: int | slice | list[int] | np.ndarray
+    ) -> float | np.ndarray:
         if isinstance(index, int):
+            if -3 <= index <= 3:
+                return self._levels[index + 3]
             return self._mean + index * self._sigma
         elif isinstance(index, slice):
-            raise NotImplementedError()
+            # Slices are of sigma levels, default -3 to +3: sigmas[-2:3].
+            start = -3 if index.start is None else index.start
+            stop = 4 if index.stop is None else index.stop
+            step = 1 if index.step is None else index.step
+            return self._mean + np.arange(start, stop, step) * self._sigma
+        elif isinstance(index, (list, np.ndarray)):
+            return self._mean + np.asarray(index) * self._sigma
         else:
             raise ValueError()
 
 
 class ControlChart(ABC):
     def __init__(self, data: pd.DataFrame):
+        # Not copied; the charts only read the data.
         self._df = data
+        self._moving_range_cache: dict[int, np.ndarray] = {}
 
     @cached_property
     @abstractmethod
@@ -192,7 +274,58 @@ class ControlChart(ABC):
         """
         return Sigmas(mean=self.mean, sigma=self.sigma)
 
-    # TODO: cache
+    @cached_property
+    def _arr(self) -> np.ndarray:
+        """
+        The subgroup rows as one contiguous float array, for the Xbar and R
+        charts
+        """
+        return np.ascontiguousarray(self._df.to_numpy(dtype=np.float64))
+
+    @cached_property
+    def _col0(self) -> np.ndarray:
+        """
+        The first column as a contiguous float array, for the individual
+        value charts
+
+        Only the first column is converted; other columns may hold anything.
+        """
+        return np.ascontiguousarray(
+            self._df.iloc[:, 0].to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+
+    @cached_property
+    def _row_range(self) -> np.ndarray:
+        """
+        Calculate the range of each subgroup (row)
+        """
+        row_range = np.ptp(self._arr, axis=1)
+        # Only rows with missing values need the slower nan-aware reduction.
+        missing = np.isnan(row_range)
+        if missing.any():
+            rows = self._arr[missing]
+            row_range[missing] = (
+                np.nanmax(rows, axis=1) - np.nanmin(rows, axis=1)
+            )
+        return row_range
+
+    @cached_property
+    def _row_mean(self) -> np.ndarray:
+        """
+        Calculate the average of each subgroup (row)
+        """
+        return np.nanmean(self._arr, axis=1)
+
+    def _moving_range(self, subgroup_size: int = 2) -> np.ndarray:
+        """
+        Calculate the moving ranges of the first column, once per size
+        """
+        if subgroup_size not in self._moving_range_cache:
+            self._moving_range_cache[subgroup_size] = _moving_ranges(
+                self._col0, subgroup_size
+            )
+        return self._moving_range_cache[subgroup_size]
+
     def _average_mr(self, subgroup_size: int = 2) -> float:
         """
         Calculate the average moving range
@@ -200,11 +333,7 @@ class ControlChart(ABC):
         if subgroup_size is None:
             subgroup_size = 2
         assert subgroup_size >= 2
-        _ = self._df.iloc[:, 0]
-        return (
-            _.rolling(subgroup_size).max() -
-            _.rolling(subgroup_size).min()
-        ).mean()
+        return np.nanmean(self._moving_range(subgroup_size))
 
 
 class X(ControlChart):
@@ -218,10 +347,7 @@ class X(ControlChart):
             subgroup_size = 2
         assert subgroup_size >= 2
         self.subgroup_size = subgroup_size
-
-    @cached_property
-    def _d2(self) -> float:
-        return CONSTANTS['d2'].loc[self.subgroup_size]
+        self._d2 = _constant('d2', subgroup_size)
 
     @cached_property
     def sigma(self) -> float:
@@ -251,7 +377,7 @@ class X(ControlChart):
         """
         Average(X)
         """
-        return self._df.iloc[:, 0].mean()
+        return np.nanmean(self._col0)
 
     @cached_property
     def y(self) -> pd.Series:
@@ -356,7 +482,8 @@ class X(ControlChart):
             fig = plt.figure()
         ax = fig.add_subplot(111)
         _despine(ax)
-        ax.plot(self.y.index, self.y,
+        y = self.y
+        ax.plot(y.index.to_numpy(), y.to_numpy(),
                 marker='o', markersize=3, color=colour1)
         ax.axhline(
             y=self.mean,
@@ -385,14 +512,12 @@ class mR(ControlChart):
             subgroup_size = 2
         assert subgroup_size >= 2
         self.subgroup_size = subgroup_size
+        self._d2 = _constant('d2', subgroup_size)
+        self._d3 = _constant('d3', subgroup_size)
 
     @cached_property
-    def _d2(self) -> float:
-        return CONSTANTS['d2'].loc[self.subgroup_size]
-
-    @cached_property
-    def _d3(self) -> float:
-        return CONSTANTS['d3'].loc[self.subgroup_size]
+    def _average_moving_range(self) -> float:
+        return self._average_mr(self.subgroup_size)
 
     @cached_property
     def sigma(self) -> float:
@@ -401,21 +526,21 @@ class mR(ControlChart):
 
         Standard deviation using rational subgroup estimator
         """
-        return self._average_mr(self.subgroup_size) * self._d3 / self._d2
+        return self._average_moving_range * self._d3 / self._d2
 
     @cached_property
     def ucl(self) -> float:
         """
         Upper control limit
         """
-        return self._average_mr(self.subgroup_size) + 3 * self.sigma
+        return self._average_moving_range + 3 * self.sigma
 
     @cached_property
     def lcl(self) -> float:
         """
         Lower control limit
         """
-        r_chart_lcl = self._average_mr(self.subgroup_size) - 3 * self.sigma
+        r_chart_lcl = self._average_moving_range - 3 * self.sigma
         if r_chart_lcl < 0:
             r_chart_lcl = 0
         return r_chart_lcl
@@ -425,15 +550,20 @@ class mR(ControlChart):
         """
         Average(mR)
         """
-        return self._average_mr(self.subgroup_size)
+        return self._average_moving_range
 
     @cached_property
     def y(self) -> pd.Series:
-        df = (
-            self._df.rolling(self.subgroup_size).max() -
-            self._df.rolling(self.subgroup_size).min()
+        moving_ranges = self._moving_range(self.subgroup_size)
+        # The first subgroup_size - 1 points have no moving range.
+        return pd.Series(
+            np.concatenate(
+                [np.full(len(self._df) - moving_ranges.size, np.nan),
+                 moving_ranges]
+            ),
+            index=self._df.index,
+            name=self._df.columns[0]
         )
-        return df[df.columns[0]]
 
     def ax(self, fig: plt.Figure = None) -> axes.Axes:
         """
@@ -504,7 +634,8 @@ class mR(ControlChart):
             fig = plt.figure()
         ax = fig.add_subplot(111)
         _despine(ax)
-        ax.plot(self.y.index, self.y,
+        y = self.y
+        ax.plot(y.index.to_numpy(), y.to_numpy(),
                 marker='o', markersize=3, color=colour2)
         # TODO? ax.set_xlim(0, len(self._df.columns))
         ax.axhline(
@@ -527,56 +658,41 @@ class Xbar(ControlChart):
     """
     Average of a subgroup of values control chart (Xbar)
     """
-    @cached_property
-    def _average_range(self) -> float:
-        'Calculate the average range'
-        return (
-            self._df.max(axis='columns') -
-            self._df.min(axis='columns')
-        ).mean()
+    def __init__(self, data: pd.DataFrame):
+        super().__init__(data)
 
-    @cached_property
-    def _subgroup_size(self) -> int:
-        return len(self._df.columns)
+        self._subgroup_size = data.shape[1]
+        self._d2 = _constant('d2', self._subgroup_size)
 
     @cached_property
-    def _d2(self) -> float:
-        return CONSTANTS['d2'].loc[len(self._df.columns)]
+    def _average_range(self) -> float:
+        'Calculate the average range'
+        return np.nanmean(self._row_range)
 
     @cached_property
     def mean(self) -> float:
         """
         Average(Xbar)
         """
-        return self._df.mean(axis='columns').mean()
+        return np.nanmean(self._row_mean)
 
     @cached_property
     def ucl(self) -> float:
         """
         Upper control limit
         """
-        return (
-            self.mean
-            + 3
-            * self._average_range
-            / (self._d2 * sqrt(self._subgroup_size))
-        )
+        return self.mean + 3 * self.sigma
 
     @cached_property
     def lcl(self) -> float:
         """
         Lower control limit
         """
-        return (
-            self.mean
-            - 3
-            * self._average_range
-            / (self._d2 * sqrt(self._subgroup_size))
-        )
+        return self.mean - 3 * self.sigma
 
     @cached_property
     def y(self) -> pd.Series:
-        return self._df.mean(axis='columns')
+        return pd.Series(self._row_mean, index=self._df.index)
 
     def ax(self, fig: plt.Figure = None) -> axes.Axes:
         """
@@ -722,7 +838,8 @@ class Xbar(ControlChart):
             fig = plt.figure()
         ax = fig.add_subplot(111)
         _despine(ax)
-        ax.plot(self.y.index, self.y,
+        y = self.y
+        ax.plot(y.index.to_numpy(), y.to_numpy(),
                 marker='o', markersize=3, color=colour2)
         ax.axhline(
             y=self.mean,
@@ -745,55 +862,40 @@ class Xbar(ControlChart):
 
         Standard deviation using rational subgroup estimator
         """
-        return self._average_range / self._d2 / sqrt(self._subgroup_size)
+        return self._average_range / (self._d2 * sqrt(self._subgroup_size))
 
 
 class R(ControlChart):
     """
     Range of a subgroup of values control chart (R)
     """
-    @cached_property
-    def _d2(self) -> float:
-        return CONSTANTS['d2'].loc[len(self._df.columns)]
+    def __init__(self, data: pd.DataFrame):
+        super().__init__(data)
 
-    @cached_property
-    def _d3(self) -> float:
-        return CONSTANTS['d3'].loc[len(self._df.columns)]
+        self._subgroup_size = data.shape[1]
+        self._d2 = _constant('d2', self._subgroup_size)
+        self._d3 = _constant('d3', self._subgroup_size)
 
     @cached_property
     def mean(self) -> float:
         """
         Average(R)
         """
-        return (
-            self._df.max(axis='columns') - self._df.min(axis='columns')
-        ).mean()
+        return np.nanmean(self._row_range)
 
     @cached_property
     def ucl(self) -> float:
         """
         Upper control limit
         """
-        return (
-            self.mean
-            + 3
-            * self._d3
-            * self.mean
-            / self._d2
-        )
+        return self.mean + 3 * self.sigma
 
     @cached_property
     def lcl(self) -> float:
         """
         Lower control limit
         """
-        ret = (
-            self.mean
-            - 3
-            * self._d3
-            * self.mean
-            / self._d2
-        )
+        ret = self.mean - 3 * self.sigma
         # Set the moving range lower control limit to 0 if it is < 0.
         if ret < 0:
             ret = 0.0
@@ -801,10 +903,7 @@ class R(ControlChart):
 
     @cached_property
     def y(self) -> pd.Series:
-        return (
-            self._df.max(axis='columns')
-            - self._df.min(axis='columns')
-        )
+        return pd.Series(self._row_range, index=self._df.index)
 
     def ax(self, fig: plt.Figure = None) -> axes.Axes:
         """
@@ -951,7 +1050,8 @@ class R(ControlChart):
             fig = plt.figure()
         ax = fig.add_subplot(111)
         _despine(ax)
-        ax.plot(self.y.index, self.y,
+        y = self.y
+        ax.plot(y.index.to_numpy(), y.to_numpy(),
                 marker='o', markersize=3, color=colour2)
         ax.axhline(
             y=self.mean,
@@ -999,23 +1099,20 @@ def draw_rule(
         The pandas Series for the points below a rule.
     """
     y_percent = (cc.y.max() - cc.y.min()) / 100
+    offset = y_percent * 5
+    annotate = ax.annotate
 
-    for x, y in above.items():
-        ax.annotate(rule_name, xy=(x, y), xytext=(x, y + y_percent * 5),
-                    color=colour4)
+    for x, y in zip(above.index, above.to_numpy()):
+        annotate(rule_name, xy=(x, y), xytext=(x, y + offset), color=colour4)
 
-    for x, y in below.items():
-        ax.annotate(rule_name, xy=(x, y), xytext=(x, y - y_percent * 5),
-                    color=colour4)
+    for x, y in zip(below.index, below.to_numpy()):
+        annotate(rule_name, xy=(x, y), xytext=(x, y - offset), color=colour4)
 
 
-# We can't use for group in series.rolling(5) because it's not implemened yet,
-# since 2015. We also can't use rolling(3) (on a bool column) .sum() >= 2
-# because we wouldn't know whether to annotate point 2 or 3 in a group. At that
-# point, you'd have to write manual Python code to figure it out. Just do a
-# plain old Python loop.
-# Here's the rolling code until we realised it wouldn't work.
-#    cc.y.loc[(cc.y > cc.sigmas[2]).rolling(2).sum() >= 2]
+# The rules annotate a particular point of each window (the 2nd of 2-of-3,
+# the 4th of 4-of-5), which a rolling count alone can't tell us. Instead,
+# _nth_in_window finds the nth flagged point at or after each window start
+# with a cumulative count and keeps it if it falls inside the window.
 
 
 # TODO: Split into separate finder and plotter.
@@ -1037,34 +1134,54 @@ def draw_rules(cc: ControlChart, ax: axes.Axes) -> None:
                         ('3', points_three),
                         ('4', points_four)]:
         above, below = rule(cc)
-        for x, y in above.items():
+        for x, y in zip(above.index, above.to_numpy()):
             aboves[(x, y)] += label
-        for x, y in below.items():
+        for x, y in zip(below.index, below.to_numpy()):
             belows[(x, y)] += label
 
     y_percent = (cc.y.max() - cc.y.min()) / 100
+    offset = y_percent * 5
+    annotate = ax.annotate
 
     for (x, y), rule_names in aboves.items():
-        ax.annotate(rule_names, xy=(x, y), xytext=(x, y + y_percent * 5),
-                    color=colour4)
+        annotate(rule_names, xy=(x, y), xytext=(x, y + offset), color=colour4)
 
     for (x, y), rule_names in belows.items():
-        ax.annotate(rule_names, xy=(x, y), xytext=(x, y - y_percent * 5),
-                    color=colour4)
+        annotate(rule_names, xy=(x, y), xytext=(x, y - offset), color=colour4)
+
+
+def _run_counts(hits: np.ndarray, resets: np.ndarray) -> np.ndarray:
+    """
+    Count the hits since the last reset, at each point
+    """
+    total = np.cumsum(hits)
+    last_reset = np.maximum.accumulate(
+        np.where(resets, np.arange(resets.size), -1)
+    )
+    return total - np.where(last_reset >= 0, total[last_reset], 0)
 
 
-T = TypeVar('T')
+def _nth_in_window(flags: np.ndarray, window: int, nth: int) -> np.ndarray:
+    """
+    Positions of the nth flagged point of every window with nth or more
+    """
+    positions = np.flatnonzero(flags)
+    starts = np.arange(flags.size - window + 1)
+    nths = np.searchsorted(positions, starts) + nth - 1
+    found = nths < positions.size
+    chosen = positions[nths[found]]
+    return np.unique(chosen[chosen < starts[found] + window])
 
 
-def _nwise(it: Iterable[T], n: int) -> Iterable[tuple[T, ...]]:
+def _points(y: pd.Series, selection: np.ndarray) -> pd.Series:
     """
-    Creates iterable m of n for points rules
+    The points of y at the selected positions
     """
-    its = tee(it, n)
-    for it_i in range(1, n):
-        for tee_times in range(it_i):
-            next(its[it_i], None)
-    return zip(*its)
+    return pd.Series(
+        y.to_numpy(dtype=np.float64)[selection],
+        index=y.index[selection],
+        dtype='float64'
+    )
 
 
 def points_one(cc: ControlChart) -> tuple[pd.Series, pd.Series]:
@@ -1123,24 +1240,10 @@ def points_two(cc: ControlChart) -> tuple[pd.Series, pd.Series]:
         - series_below: pd.Series
             The series of points below the control limit.
     """
-
-    points_above = []
-    points_below = []
-    for group in _nwise(cc.y.items(), 3):
-        above_in_window = [(x, y)
-                           for x, y
-                           in group
-                           if y > cc.sigmas[+2]]
-        if len(above_in_window) >= 2:
-            points_above.append(above_in_window[1])  # whether 2 or 3, 2nd
-        below_in_window = [(x, y)
-                           for x, y
-                           in group
-                           if y < cc.sigmas[-2]]
-        if len(below_in_window) >= 2:
-            points_below.append(below_in_window[1])  # whether 2 or 3, 2nd
-    series_above = (pd.Series(dict(points_above), dtype='float64'))
-    series_below = (pd.Series(dict(points_below), dtype='float64'))
+    y = cc.y
+    values = y.to_numpy(dtype=np.float64)
+    series_above = _points(y, _nth_in_window(values > cc.sigmas[+2], 3, 2))
+    series_below = _points(y, _nth_in_window(values < cc.sigmas[-2], 3, 2))
     return (series_above, series_below)
 
 
@@ -1170,23 +1273,10 @@ def points_three(cc: ControlChart) -> tuple[pd.Series, pd.Series]:
         - series_below: pd.Series
             The series of points below the control limit.
     """
-    points_above = []
-    points_below = []
-    for group in _nwise(cc.y.items(), 5):
-        above_in_window = [(x, y)
-                           for x, y
-                           in group
-                           if y > cc.sigmas[+1]]
-        if len(above_in_window) >= 4:
-            points_above.append(above_in_window[3])  # whether 4 or 5, 4th point
-        below_in_window = [(x, y)
-                           for x, y
-                           in group
-                           if y < cc.sigmas[-1]]
-        if len(below_in_window) >= 4:
-            points_below.append(below_in_window[3])  # whether 4 or 5, 4th point
-    series_above = (pd.Series(dict(points_above), dtype='float64'))
-    series_below = (pd.Series(dict(points_below), dtype='float64'))
+    y = cc.y
+    values = y.to_numpy(dtype=np.float64)
+    series_above = _points(y, _nth_in_window(values > cc.sigmas[+1], 5, 4))
+    series_below = _points(y, _nth_in_window(values < cc.sigmas[-1], 5, 4))
     return (series_above, series_below)
 
 
@@ -1215,23 +1305,17 @@ def points_four(cc: ControlChart) -> tuple[pd.Series, pd.Series]:
         - series_below: pd.Series
             The series of points below the control limit.
     """
-    count_above = 0
-    count_below = 0
-    points_above = []
-    points_below = []
-    for x, y in cc.y.items():
-        if y > cc.mean:
-            count_above += 1
-            count_below = 0
-        elif y < cc.mean:
-            count_above = 0
-            count_below += 1
-        if count_above >= 8:
-            points_above.append((x, y))
-        elif count_below >= 8:
-            points_below.append((x, y))
-    series_above = (pd.Series(dict(points_above), dtype='float64'))
-    series_below = (pd.Series(dict(points_below), dtype='float64'))
+    y = cc.y
+    values = y.to_numpy(dtype=np.float64)
+    above = values > cc.mean
+    below = values < cc.mean
+    # Points on the central line (or missing) neither extend nor end a run.
+    count_above = _run_counts(above, below)
+    count_below = _run_counts(below, above)
+    mask_above = count_above >= 8
+    mask_below = ~mask_above & (count_below >= 8)
+    series_above = _points(y, mask_above)
+    series_below = _points(y, mask_below)
     return (series_above, series_below)
 
 
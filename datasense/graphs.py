@@ -20,11 +20,11 @@ from datasense import natural_cubic_spline, html_ds
 from matplotlib.ticker import StrMethodFormatter
 from matplotlib.offsetbox import AnchoredText
 from matplotlib import rcParams as rc
+from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 import matplotlib.artist as mpla
 import matplotlib.pyplot as plt
 import matplotlib.axes as axes
-import pyqrcode as pq
 import pandas as pd
 import numpy as np
 
@@ -41,6 +41,126 @@ colour_grey = "#bbbbbb"
 # other colours
 colour_white = "#ffffff"
 
+# Set to False to create figures without pyplot, e.g. when saving many in a
+# batch. They are then not registered with pyplot, so plt.show() does not
+# display them, and they are freed as soon as they are no longer referenced.
+_USE_PYPLOT = True
+# Scatter series with at least this many points are drawn with ax.scatter,
+# whose single PathCollection draws markers faster than a markers-only Line2D.
+_SCATTER_THRESHOLD = 5_000
+
+
+def _subplots(
+    *,
+    figsize: tuple[float, float] = None
+) -> tuple[plt.Figure, axes.Axes]:
+    """
+    Create a figure with one Axes, through pyplot unless _USE_PYPLOT is False.
+    """
+    if _USE_PYPLOT:
+        return plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig = Figure(figsize=figsize)
+    return (fig, fig.subplots(nrows=1, ncols=1))
+
+
+def _as_array(data: pd.Series) -> pd.Series | np.ndarray:
+    """
+    Return the values of a series for matplotlib, without a copy.
+
+    Datetime series are returned unchanged so that the pandas date
+    converters, and format_dates, still apply.
+    """
+    if isinstance(data, pd.Series) and data.dtype.kind != "M":
+        return data.to_numpy()
+    return data
+
+
+def _datetime_as_int64(data: pd.Series) -> np.ndarray:
+    """
+    Return datetimes as int64 nanoseconds for spline fitting.
+
+    For datetime64[ns] data this is a view of the values, not a copy.
+    """
+    return data.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def _plot_points(
+    ax: axes.Axes,
+    X: pd.Series | np.ndarray,
+    y: pd.Series | np.ndarray,
+    *,
+    marker: str,
+    markersize: float,
+    colour: str,
+    rasterized: bool = False
+) -> None:
+    """
+    Plot y versus X as unjoined points, with ax.scatter for large series.
+    """
+    if y.size >= _SCATTER_THRESHOLD:
+        ax.scatter(
+            X,
+            y,
+            s=markersize ** 2,
+            c=colour,
+            marker=marker,
+            linewidths=0,
+            rasterized=rasterized,
+        )
+    else:
+        ax.plot(
+            X,
+            y,
+            marker=marker,
+            markersize=markersize,
+            linestyle="None",
+            color=colour,
+            rasterized=rasterized,
+        )
+
+
+def _m4_downsample(
+    X: pd.Series | np.ndarray,
+    y: np.ndarray,
+    max_points: int
+) -> tuple[pd.Series | np.ndarray, np.ndarray]:
+    """
+    Reduce a line to at most max_points points with M4 aggregation.
+
+    The range of X is split into max_points // 4 bins of equal width. The
+    first, last, minimum, and maximum points of each bin are kept, in order.
+    The line is returned unchanged if it already has at most max_points
+    points.
+
+    Raises ValueError if max_points is less than 4, or if X has missing
+    values or is not in increasing order.
+    """
+    if max_points < 4:
+        raise ValueError(f"max_points must be at least 4, not {max_points}")
+    if pd.isna(X).any():
+        raise ValueError("X must not have missing values to use max_points")
+    if X.dtype.kind == "M":
+        x = _datetime_as_int64(X)
+    else:
+        x = np.asarray(X, dtype=np.float64)
+    if (np.diff(x) < 0).any():
+        raise ValueError("X must be in increasing order to use max_points")
+    if y.size <= max_points:
+        return (X, y)
+    number_bins = max_points // 4
+    edges = np.linspace(x[0], x[-1], number_bins + 1)
+    # Empty bins start where the next bin starts; keep one start for each.
+    starts = np.unique(np.searchsorted(x, edges[:-1]))
+    ends = np.append(starts[1:], x.size) - 1
+    bins = np.repeat(np.arange(starts.size), ends - starts + 1)
+    # Sorting by bin, then value, puts each bin's min (or max) at its start.
+    minima = np.lexsort((y, bins))[starts]
+    maxima = np.lexsort((-y, bins))[starts]
+    keep = np.unique(np.concatenate((starts, minima, maxima, ends)))
+    if isinstance(X, pd.Series):
+        return (X.iloc[keep], y[keep])
+    return (X[keep], y[keep])
+
 
 def plot_scatter_y(
     *,
@@ -52,6 +172,7 @@ def plot_scatter_y(
     markersize: float = 8,
     colour: str = colour_blue,
     remove_spines: bool = True,
+    rasterize_threshold: int = 50_000,
 ) -> tuple[plt.Figure, axes.Axes]:
     """
     Scatter plot of y. Optional smoothing applied to y.
@@ -82,6 +203,9 @@ def plot_scatter_y(
         The colour of the plot point (hexadecimal triplet string).
     remove_spines: bool = True
         If True, remove top and right spines of axes.
+    rasterize_threshold: int = 50_000
+        Series with more points than this are drawn as a raster image when
+        saved to a vector format (PDF, SVG), which keeps the file small.
 
     Returns
     -------
@@ -108,27 +232,29 @@ def plot_scatter_y(
     ...     colour=colour_orange
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     # generate X series, required if using smoothing
-    X = pd.Series(range(1, y.size + 1, 1))
+    X = np.arange(1, y.size + 1)
     if smoothing is None:
-        ax.plot(
+        _plot_points(
+            ax,
             X,
             y,
             marker=marker,
             markersize=markersize,
-            linestyle="None",
-            color=colour,
+            colour=colour,
+            rasterized=y.size > rasterize_threshold,
         )
     elif smoothing == "natural_cubic_spline":
         model = natural_cubic_spline(X=X, y=y, number_knots=number_knots)
-        ax.plot(
+        _plot_points(
+            ax,
             X,
             model.predict(X),
             marker=marker,
             markersize=markersize,
-            linestyle="None",
-            color=colour,
+            colour=colour,
+            rasterized=y.size > rasterize_threshold,
         )
     if remove_spines:
         despine(ax=ax)
@@ -146,6 +272,7 @@ def plot_scatter_x_y(
     markersize: float = 4,
     colour: str = colour_blue,
     remove_spines: bool = True,
+    rasterize_threshold: int = 50_000,
 ) -> tuple[plt.Figure, axes.Axes]:
     """
     Scatter plot of y versus X.  Optional smoothing applied to y.
@@ -176,6 +303,9 @@ def plot_scatter_x_y(
         The colour of the plot point (hexadecimal triplet string).
     remove_spines: bool = True
         If True, remove top and right spines of axes.
+    rasterize_threshold: int = 50_000
+        Series with more points than this are drawn as a raster image when
+        saved to a vector format (PDF, SVG), which keeps the file small.
 
     Returns
     -------
@@ -222,32 +352,35 @@ def plot_scatter_x_y(
     ...     y=series_y
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    X, y = _as_array(X), _as_array(y)
+    fig, ax = _subplots(figsize=figsize)
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax)
-        ax.plot(
+        _plot_points(
+            ax,
             X,
             y,
             marker=marker,
             markersize=markersize,
-            linestyle="None",
-            color=colour,
+            colour=colour,
+            rasterized=y.size > rasterize_threshold,
         )
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             fig.autofmt_xdate()
         else:
             XX = X
         model = natural_cubic_spline(X=XX, y=y, number_knots=number_knots)
-        ax.plot(
+        _plot_points(
+            ax,
             X,
             model.predict(XX),
             marker=marker,
             markersize=markersize,
-            linestyle="None",
-            color=colour,
+            colour=colour,
+            rasterized=y.size > rasterize_threshold,
         )
     if remove_spines:
         despine(ax=ax)
@@ -265,6 +398,7 @@ def plot_line_y(
     linestyle: str = "-",
     colour: str = colour_blue,
     remove_spines: bool = True,
+    max_points: int = None,
 ) -> tuple[plt.Figure, axes.Axes]:
     """
     Line plot of y. Optional smoothing applied to y.
@@ -297,6 +431,13 @@ def plot_line_y(
         The colour of the plot point (hexadecimal triplet string).
     remove_spines: bool = True
         If True, remove top and right spines of axes.
+    max_points: int = None
+        If given and y has more points, plot at most max_points points with
+        M4 aggregation: the first, last, minimum, and maximum of y in each
+        of max_points // 4 equal intervals of the abscissa. About four times
+        the width of the axes in pixels looks the same as the full line.
+        Must be at least 4. M4 aggregation needs an increasing abscissa,
+        which 1 to the size of y always is. Not applied to smoothed lines.
 
     Returns
     -------
@@ -323,12 +464,15 @@ def plot_line_y(
     ...     colour=colour_orange
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
-    X = pd.Series(range(1, y.size + 1, 1))
+    fig, ax = _subplots(figsize=figsize)
+    X = np.arange(1, y.size + 1)
     if smoothing is None:
+        X_plot, y_plot = X, _as_array(y)
+        if max_points is not None:
+            X_plot, y_plot = _m4_downsample(X_plot, y_plot, max_points)
         ax.plot(
-            X,
-            y,
+            X_plot,
+            y_plot,
             marker=marker,
             markersize=markersize,
             linestyle=linestyle,
@@ -362,6 +506,7 @@ def plot_line_x_y(
     linewidth: float = 1,
     colour: str = colour_blue,
     remove_spines: bool = True,
+    max_points: int = None,
 ) -> tuple[plt.Figure, axes.Axes]:
     """
     Scatter plot of y versus X. Optional smoothing applied to y.
@@ -396,6 +541,13 @@ def plot_line_x_y(
         The colour of the plot point (hexadecimal triplet string).
     remove_spines: bool = True
         IF True, remove top and right spines of axes.
+    max_points: int = None
+        If given and y has more points, plot at most max_points points with
+        M4 aggregation: the first, last, minimum, and maximum of y in each
+        of max_points // 4 equal intervals of the abscissa. About four times
+        the width of the axes in pixels looks the same as the full line.
+        Must be at least 4. X must be in increasing order, without missing
+        values. Not applied to smoothed lines.
 
     Returns
     -------
@@ -445,13 +597,17 @@ def plot_line_x_y(
     ...     y=y
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    X, y = _as_array(X), _as_array(y)
+    fig, ax = _subplots(figsize=figsize)
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax)
+        X_plot, y_plot = X, y
+        if max_points is not None:
+            X_plot, y_plot = _m4_downsample(X_plot, y_plot, max_points)
         ax.plot(
-            X,
-            y,
+            X_plot,
+            y_plot,
             marker=marker,
             markersize=markersize,
             linestyle=linestyle,
@@ -459,8 +615,8 @@ def plot_line_x_y(
             color=colour,
         )
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             # TODO: is this necessary?
             fig.autofmt_xdate()
         else:
@@ -479,7 +635,6 @@ def plot_line_x_y(
         )
     if remove_spines:
         despine(ax=ax)
-    plt.close("all")
     return (fig, ax)
 
 
@@ -504,6 +659,7 @@ def plot_scatter_scatter_x_y1_y2(
     labellegendy1: str = None,
     labellegendy2: str = None,
     remove_spines: bool = True,
+    rasterize_threshold: int = 50_000,
 ) -> tuple[plt.Figure, axes.Axes]:
     """
     Scatter plot of y1 versus X.
@@ -558,6 +714,9 @@ def plot_scatter_scatter_x_y1_y2(
         The legend label of the line y2.
     remove_spines: booll = True
         IF True, remove top and right spines of axes.
+    rasterize_threshold: int = 50_000
+        Series with more points than this are drawn as a raster image when
+        saved to a vector format (PDF, SVG), which keeps the file small.
 
     Returns
     -------
@@ -599,9 +758,10 @@ def plot_scatter_scatter_x_y1_y2(
     ... )
     >>> ax.legend(frameon=False) # doctest: +SKIP
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    X, y1, y2 = _as_array(X), _as_array(y1), _as_array(y2)
+    fig, ax = _subplots(figsize=figsize)
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax)
         ax.plot(
             X,
@@ -612,6 +772,7 @@ def plot_scatter_scatter_x_y1_y2(
             linewidth=linewidth1,
             color=colour1,
             label=labellegendy1,
+            rasterized=y1.size > rasterize_threshold,
         )
         ax.plot(
             X,
@@ -622,35 +783,37 @@ def plot_scatter_scatter_x_y1_y2(
             linewidth=linewidth2,
             color=colour2,
             label=labellegendy2,
+            rasterized=y2.size > rasterize_threshold,
         )
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             fig.autofmt_xdate()
         else:
             XX = X
-        model1 = natural_cubic_spline(X=XX, y=y1, number_knots=number_knots)
-        model2 = natural_cubic_spline(X=XX, y=y2, number_knots=number_knots)
-        ax.plot(
+        # The series share the abscissa, so one fit covers them all.
+        model = natural_cubic_spline(
+            X=XX, y=np.column_stack([y1, y2]), number_knots=number_knots
+        )
+        predictions = model.predict(XX)
+        _plot_points(
+            ax,
             X,
-            model1.predict(X),
+            predictions[:, 0],
             marker=marker1,
             markersize=markersize1,
-            linestyle="None",
-            linewidth=linewidth1,
-            color=colour1,
+            colour=colour1,
+            rasterized=y1.size > rasterize_threshold,
         )
-        ax.plot(
+        _plot_points(
+            ax,
             X,
-            model2.predict(X),
+            predictions[:, 1],
             marker=marker2,
             markersize=markersize2,
-            linestyle="None",
-            linewidth=linewidth2,
-            color=colour2,
+            colour=colour2,
+            rasterized=y2.size > rasterize_threshold,
         )
-        ax.plot(X, model1.predict(XX), marker=".", linestyle="", color=colour1)
-        ax.plot(X, model2.predict(XX), marker=".", linestyle="", color=colour2)
     if remove_spines:
         despine(ax=ax)
     return (fig, ax)
@@ -678,6 +841,7 @@ def plot_scatter_scatter_x1_x2_y1_y2(
     labellegendy1: str = None,
     labellegendy2: str = None,
     remove_spines: bool = True,
+    rasterize_threshold: int = 50_000,
 ) -> tuple[plt.Figure, axes.Axes]:
     """
     Scatter plot of y1 versus X1.
@@ -734,6 +898,9 @@ def plot_scatter_scatter_x1_x2_y1_y2(
         The legend label of the line y2.
     remove_spines: bool = True
         If True, remove top and right spines of axes.
+    rasterize_threshold: int = 50_000
+        Series with more points than this are drawn as a raster image when
+        saved to a vector format (PDF, SVG), which keeps the file small.
 
     Returns
     -------
@@ -809,65 +976,49 @@ def plot_scatter_scatter_x1_x2_y1_y2(
     ... )
     >>> ax.legend(frameon=False) # doctest: +SKIP
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    X1, X2 = _as_array(X1), _as_array(X2)
+    y1, y2 = _as_array(y1), _as_array(y2)
+    fig, ax = _subplots(figsize=figsize)
+    # The data points are drawn the same way with or without smoothing.
+    points1 = dict(
+        marker=marker1,
+        markersize=markersize1,
+        linestyle=linestyle1,
+        linewidth=linewidth1,
+        color=colour1,
+        label=labellegendy1,
+        rasterized=y1.size > rasterize_threshold,
+    )
+    points2 = dict(
+        marker=marker2,
+        markersize=markersize2,
+        linestyle=linestyle2,
+        linewidth=linewidth2,
+        color=colour2,
+        label=labellegendy2,
+        rasterized=y2.size > rasterize_threshold,
+    )
     if smoothing is None:
-        if (X1.dtype and X2.dtype) in ["datetime64[ns]"]:
+        if X1.dtype.kind == "M" and X2.dtype.kind == "M":
             format_dates(fig=fig, ax=ax)
-        ax.plot(
-            X1,
-            y1,
-            marker=marker1,
-            markersize=markersize1,
-            linestyle=linestyle1,
-            linewidth=linewidth1,
-            color=colour1,
-            label=labellegendy1,
-        )
-        ax.plot(
-            X2,
-            y2,
-            marker=marker2,
-            markersize=markersize2,
-            linestyle=linestyle2,
-            linewidth=linewidth2,
-            color=colour2,
-            label=labellegendy2,
-        )
+        ax.plot(X1, y1, **points1)
+        ax.plot(X2, y2, **points2)
     elif smoothing == "natural_cubic_spline":
-        if (X1.dtype and X2.dtype) in ["datetime64[ns]"]:
-            XX1 = pd.to_numeric(X1)
-            XX2 = pd.to_numeric(X2)
+        if X1.dtype.kind == "M" and X2.dtype.kind == "M":
+            XX1 = _datetime_as_int64(X1)
+            XX2 = _datetime_as_int64(X2)
             fig.autofmt_xdate()
         else:
             XX1 = X1
             XX2 = X2
         model1 = natural_cubic_spline(X=XX1, y=y1, number_knots=number_knots)
         model2 = natural_cubic_spline(X=XX2, y=y2, number_knots=number_knots)
-        ax.plot(
-            X1,
-            y1,
-            marker=marker1,
-            markersize=markersize1,
-            linestyle=linestyle1,
-            linewidth=linewidth1,
-            color=colour1,
-            label=labellegendy1,
-        )
-        ax.plot(
-            X2,
-            y2,
-            marker=marker2,
-            markersize=markersize2,
-            linestyle=linestyle2,
-            linewidth=linewidth2,
-            color=colour2,
-            label=labellegendy2,
-        )
+        ax.plot(X1, y1, **points1)
+        ax.plot(X2, y2, **points2)
         ax.plot(
             X1,
             model1.predict(XX1),
-            marker=marker1,
-            markersize=0,
+            marker="",
             linestyle="-",
             linewidth=linewidth1,
             color=colour1,
@@ -875,8 +1026,7 @@ def plot_scatter_scatter_x1_x2_y1_y2(
         ax.plot(
             X2,
             model2.predict(XX2),
-            marker=marker2,
-            markersize=0,
+            marker="",
             linestyle="-",
             linewidth=linewidth2,
             color=colour2,
@@ -973,9 +1123,10 @@ def plot_scatter_line_x_y1_y2(
     ...     labellegendy2=f'number knots = {number_knots}'
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    X, y1, y2 = _as_array(X), _as_array(y1), _as_array(y2)
+    fig, ax = _subplots(figsize=figsize)
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax)
         ax.plot(
             X,
@@ -994,23 +1145,26 @@ def plot_scatter_line_x_y1_y2(
             label=labellegendy2,
         )
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             fig.autofmt_xdate()
         else:
             XX = X
-        model1 = natural_cubic_spline(X=XX, y=y1, number_knots=number_knots)
-        model2 = natural_cubic_spline(X=XX, y=y2, number_knots=number_knots)
+        # The series share the abscissa, so one fit covers them all.
+        model = natural_cubic_spline(
+            X=XX, y=np.column_stack([y1, y2]), number_knots=number_knots
+        )
+        predictions = model.predict(XX)
         ax.plot(
             X,
-            model1.predict(XX),
+            predictions[:, 0],
             marker=y1_marker,
             linestyle="",
             color=colour1,
         )
         ax.plot(
             X,
-            model2.predict(XX),
+            predictions[:, 1],
             marker=y2_marker,
             linestyle="-",
             color=colour2,
@@ -1114,8 +1268,8 @@ def plot_line_line_y1_y2(
     ...     y2=series_y2
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
-    X = pd.Series(range(1, y1.size + 1, 1))
+    fig, ax = _subplots(figsize=figsize)
+    X = np.arange(1, y1.size + 1)
     if smoothing is None:
         ax.plot(
             X,
@@ -1138,13 +1292,16 @@ def plot_line_line_y1_y2(
             label=labellegendy2,
         )
     elif smoothing == "natural_cubic_spline":
-        model1 = natural_cubic_spline(X=X, y=y1, number_knots=number_knots)
-        model2 = natural_cubic_spline(X=X, y=y2, number_knots=number_knots)
+        # The series share the abscissa, so one fit covers them all.
+        model = natural_cubic_spline(
+            X=X, y=np.column_stack([y1, y2]), number_knots=number_knots
+        )
+        predictions = model.predict(X)
         ax.plot(
-            X, model1.predict(X), marker=None, linestyle="-", color=colour1
+            X, predictions[:, 0], marker=None, linestyle="-", color=colour1
         )
         ax.plot(
-            X, model2.predict(X), marker=None, linestyle="-", color=colour2
+            X, predictions[:, 1], marker=None, linestyle="-", color=colour2
         )
     if remove_spines:
         despine(ax=ax)
@@ -1251,9 +1408,9 @@ def plot_line_line_x_y1_y2(
     ...     figsize=figsize
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax)
         ax.plot(
             X,
@@ -1276,18 +1433,21 @@ def plot_line_line_x_y1_y2(
             label=labellegendy2,
         )
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             fig.autofmt_xdate()
         else:
             XX = X
-        model1 = natural_cubic_spline(X=XX, y=y1, number_knots=number_knots)
-        model2 = natural_cubic_spline(X=XX, y=y2, number_knots=number_knots)
+        # The series share the abscissa, so one fit covers them all.
+        model = natural_cubic_spline(
+            X=XX, y=np.column_stack([y1, y2]), number_knots=number_knots
+        )
+        predictions = model.predict(XX)
         ax.plot(
-            X, model1.predict(XX), marker=None, linestyle="-", color=colour1
+            X, predictions[:, 0], marker=None, linestyle="-", color=colour1
         )
         ax.plot(
-            X, model2.predict(XX), marker=None, linestyle="-", color=colour2
+            X, predictions[:, 1], marker=None, linestyle="-", color=colour2
         )
     if remove_spines:
         despine(ax=ax)
@@ -1405,9 +1565,9 @@ def plot_line_line_line_x_y1_y2_y3(
     ...     labellegendy3="predicted"
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax)
         ax.plot(
             X,
@@ -1434,22 +1594,24 @@ def plot_line_line_line_x_y1_y2_y3(
             label=labellegendy3,
         )
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             fig.autofmt_xdate()
         else:
             XX = X
-        model1 = natural_cubic_spline(X=XX, y=y1, number_knots=number_knots)
-        model2 = natural_cubic_spline(X=XX, y=y2, number_knots=number_knots)
-        model3 = natural_cubic_spline(X=XX, y=y3, number_knots=number_knots)
+        # The series share the abscissa, so one fit covers them all.
+        model = natural_cubic_spline(
+            X=XX, y=np.column_stack([y1, y2, y3]), number_knots=number_knots
+        )
+        predictions = model.predict(XX)
         ax.plot(
-            X, model1.predict(XX), marker=None, linestyle="-", color=colour1
+            X, predictions[:, 0], marker=None, linestyle="-", color=colour1
         )
         ax.plot(
-            X, model2.predict(XX), marker=None, linestyle="-", color=colour2
+            X, predictions[:, 1], marker=None, linestyle="-", color=colour2
         )
         ax.plot(
-            X, model3.predict(XX), marker=None, linestyle="-", color=colour3
+            X, predictions[:, 2], marker=None, linestyle="-", color=colour3
         )
     if remove_spines:
         despine(ax=ax)
@@ -1531,31 +1693,34 @@ def plot_scatterleft_scatterright_x_y1_y2(
     ...     linestyle2="-"
     ... )
     """
-    fig, ax1 = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax1 = _subplots(figsize=figsize)
     ax2 = ax1.twinx()
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax1)
         ax1.plot(X, y1, marker=".", linestyle=linestyle1, color=colour1)
         ax2.plot(X, y2, marker=".", linestyle=linestyle2, color=colour2)
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             fig.autofmt_xdate()
         else:
             XX = X
-        model1 = natural_cubic_spline(X=XX, y=y1, number_knots=number_knots)
-        model2 = natural_cubic_spline(X=XX, y=y2, number_knots=number_knots)
+        # The series share the abscissa, so one fit covers them all.
+        model = natural_cubic_spline(
+            X=XX, y=np.column_stack([y1, y2]), number_knots=number_knots
+        )
+        predictions = model.predict(XX)
         ax1.plot(
             X,
-            model1.predict(XX),
+            predictions[:, 0],
             marker=".",
             linestyle=linestyle1,
             color=colour1,
         )
         ax2.plot(
             X,
-            model2.predict(XX),
+            predictions[:, 1],
             marker=".",
             linestyle=linestyle2,
             color=colour2,
@@ -1690,23 +1855,26 @@ def plot_lineleft_lineright_x_y1_y2(
     ...     figsize=figsize
     ... )
     """
-    fig, ax1 = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax1 = _subplots(figsize=figsize)
     ax2 = ax1.twinx()
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax1, defaultfmt=defaultfmt)
         ax1.plot(X, y1, color=colour1, marker=marker1, markersize=marker1size, label=labellegendy1)
         ax2.plot(X, y2, color=colour2, marker=marker2, markersize=marker2size, label=labellegendy2)
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             fig.autofmt_xdate()
         else:
             XX = X
-        model1 = natural_cubic_spline(X=XX, y=y1, number_knots=number_knots)
-        model2 = natural_cubic_spline(X=XX, y=y2, number_knots=number_knots)
-        ax1.plot(X, model1.predict(XX), color=colour1, linestyle=linestyle1)
-        ax2.plot(X, model2.predict(XX), color=colour2, linestyle=linestyle2)
+        # The series share the abscissa, so one fit covers them all.
+        model = natural_cubic_spline(
+            X=XX, y=np.column_stack([y1, y2]), number_knots=number_knots
+        )
+        predictions = model.predict(XX)
+        ax1.plot(X, predictions[:, 0], color=colour1, linestyle=linestyle1)
+        ax2.plot(X, predictions[:, 1], color=colour2, linestyle=linestyle2)
     for tl in ax1.get_yticklabels():
         tl.set_color(colour1)
     for tl in ax2.get_yticklabels():
@@ -1717,7 +1885,6 @@ def plot_lineleft_lineright_x_y1_y2(
         ha="right",
         rotation_mode="anchor",
     )
-    plt.close("all")
     return (fig, ax1, ax2)
 
 
@@ -1805,23 +1972,26 @@ def plot_barleft_lineright_x_y1_y2(
     ...     colour2="#ee3377"
     ... )
     """
-    fig, ax1 = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax1 = _subplots(figsize=figsize)
     ax2 = ax1.twinx()
     if smoothing is None:
-        if X.dtype in ["datetime64[ns]"]:
+        if X.dtype.kind == "M":
             format_dates(fig=fig, ax=ax1)
         ax1.bar(X, y1, barwidth, color=colour1)
         ax2.plot(X, y2, color=colour2, marker=marker2)
     elif smoothing == "natural_cubic_spline":
-        if X.dtype in ["datetime64[ns]"]:
-            XX = pd.to_numeric(X)
+        if X.dtype.kind == "M":
+            XX = _datetime_as_int64(X)
             fig.autofmt_xdate()
         else:
             XX = X
-        model1 = natural_cubic_spline(X=XX, y=y1, number_knots=number_knots)
-        model2 = natural_cubic_spline(X=XX, y=y2, number_knots=number_knots)
-        ax1.plot(X, model1.predict(XX), color=colour1, linestyle=linestyle1)
-        ax2.plot(X, model2.predict(XX), color=colour2, linestyle=linestyle2)
+        # The series share the abscissa, so one fit covers them all.
+        model = natural_cubic_spline(
+            X=XX, y=np.column_stack([y1, y2]), number_knots=number_knots
+        )
+        predictions = model.predict(XX)
+        ax1.plot(X, predictions[:, 0], color=colour1, linestyle=linestyle1)
+        ax2.plot(X, predictions[:, 1], color=colour2, linestyle=linestyle2)
     for tl in ax1.get_yticklabels():
         tl.set_color(colour1)
     for tl in ax2.get_yticklabels():
@@ -1894,7 +2064,7 @@ def plot_pareto(
     total_y = df[y.name].sum()
     df["percentage"] = df[y.name] / total_y * 100
     df["cumulative_percentage"] = df["percentage"].cumsum(skipna=True)
-    fig, ax1 = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax1 = _subplots(figsize=figsize)
     ax2 = ax1.twinx()
     ax1.bar(x=df[X.name], height=df[y.name], width=width, color=colour1)
     ax2.plot(
@@ -1996,7 +2166,7 @@ def probability_plot(
     >>> data = ds.random_data()
     >>> fig, ax = ds.probability_plot(data=data)
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     (osm, osr), (slope, intercept, r) = probplot(
         x=data, dist=distribution, fit=True, plot=ax
     )
@@ -2184,7 +2354,7 @@ def plot_histogram(
     >>> ax.set_xlabel(xlabel="X-axis label", labelpad=30) # doctest: +SKIP
     >>> plt.tight_layout()
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     if bin_width and not bin_range:
         x = (series.max() - series.min()) / bin_width
         number_bins = math.ceil(x)
@@ -2341,7 +2511,7 @@ def plot_horizontal_bars(
     >>> ax.set_xticks(ticks=x_ticks) # doctest: +SKIP
     >>> ax.set_xticklabels(labels=x_labels, rotation=45) # doctest: +SKIP
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     ax.barh(
         y=y,
         width=width,
@@ -2411,7 +2581,7 @@ def plot_vertical_bars(
     ...     width=0.4
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     ax.bar(
         x=x,
         height=height,
@@ -2420,7 +2590,6 @@ def plot_vertical_bars(
         linewidth=linewidth,
         color=color,
     )
-    plt.close("all")
     return (fig, ax)
 
 
@@ -2482,7 +2651,7 @@ def plot_pie(
     ...     ]
     ... )
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     ax.pie(
         x=x,
         labels=labels,
@@ -2586,7 +2755,7 @@ def waterfall(
     step = df_blank.reset_index(drop=True).repeat(3).shift(-1)
     step[1::3] = np.nan
     df_blank.loc[last_column] = 0
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
     x = df.index  # bar positions
     # create the waterfall chart, no need for a stacked argument
     ax.bar(x=x, height=df[amount], width=0.4, bottom=df_blank)
@@ -2761,7 +2930,7 @@ def plot_stacked_bars(
     ... )
     >>> fig.legend(frameon=False, loc="upper right") # doctest: +SKIP
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     ax.bar(x=x, height=height1, label=label1, width=width, color=color[0])
     if label2:
         ax.bar(
@@ -2844,6 +3013,9 @@ def qr_code(*, qr_code_string: str, qr_code_path: Path) -> None:
     >>> code_path = Path("str_of_path")
     >>> ds.qr_code(qr_code_string=code_string, qr_code_path=code_path)
     """
+    # Only needed here; importing it lazily keeps it off the import path.
+    import pyqrcode as pq
+
     pq.create(content=qr_code_string).svg(
         qr_code_path.with_suffix(".svg"), scale=4
     )
@@ -2904,7 +3076,7 @@ def plot_boxplot(
     >>> ax.set_ylabel("y") # doctest: +SKIP
     >>> ds.despine(ax=ax) # doctest: +SKIP
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1, figsize=figsize)
+    fig, ax = _subplots(figsize=figsize)
     ax.boxplot(x=series, notch=notch, showmeans=showmeans)
     if remove_spines:
         despine(ax=ax)
@@ -3229,7 +3401,7 @@ def plot_boxcox(
     - https://www.itl.nist.gov/div898/handbook/eda/section3/eda336.htm
     - https://www.itl.nist.gov/div898/handbook/eda/section3/boxcox.htm
     """
-    fig, ax = plt.subplots(nrows=1, ncols=1)
+    fig, ax = _subplots()
     boxcox_normplot(x=s, la=la, lb=lb, plot=ax)
     ax.get_lines()[0].set(color=colour1, marker=marker, markersize=markersize)
     boxcox_array, lmax_mle, (min_ci, max_ci) = boxcox(
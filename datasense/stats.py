@@ -18,7 +18,6 @@ import sys
 from sklearn.linear_model import LinearRegression
 from statsmodels.stats.power import TTestIndPower
 from basis_expansions import NaturalCubicSpline
-from scipy.stats.mstats import mquantiles as mq
 from scipy.stats import norm, uniform, randint
 from statsmodels.stats.power import TTestPower
 from pandas.api.types import CategoricalDtype
@@ -35,13 +34,99 @@ import numpy as np
 pd.options.display.max_columns = 600
 pd.options.display.max_rows = 600
 
+_QUARTILES = (0.25, 0.50, 0.75)
+# The (alphap, betap) plotting positions of nonparametric_summary, one row
+# per method, named as in numpy.quantile where NumPy has an equivalent.
+_PLOTTING_POSITION_METHODS = (
+    "interpolated_inverted_cdf",
+    "hazen",
+    "weibull",
+    "linear",
+    "median_unbiased",
+    "normal_unbiased",
+    "cunnane",
+    "apl",
+)
+_PLOTTING_POSITIONS = np.array(
+    [
+        [0, 1],
+        [0.5, 0.5],
+        [0, 0],
+        [1, 1],
+        [1/3, 1/3],
+        [3/8, 3/8],
+        [0.4, 0.4],
+        [0.35, 0.35],
+    ],
+    dtype=np.float64
+)
+
+
+def _plotting_position_quantiles(
+    *,
+    x: np.ndarray,
+    probs: tuple[float, ...],
+    alphap: float | np.ndarray,
+    betap: float | np.ndarray
+) -> np.ndarray:
+    """
+    Calculate empirical quantiles.
+
+    Same estimator as scipy.stats.mstats.mquantiles, but the data are only
+    partitioned around the order statistics needed, in one pass for every
+    probability and plotting position, instead of sorted.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The input data, without missing values.
+    probs : tuple[float, ...]
+        The probabilities of the quantiles.
+    alphap : float | np.ndarray
+        Plotting positions. An array gives one row of quantiles per element.
+    betap : float | np.ndarray
+        Plotting positions. Same shape as alphap.
+
+    Returns
+    -------
+    np.ndarray
+        The quantiles, one per probability, for each plotting position.
+    """
+    p = np.asarray(probs, dtype=np.float64)
+    alphap = np.asarray(alphap, dtype=np.float64)[..., np.newaxis]
+    betap = np.asarray(betap, dtype=np.float64)[..., np.newaxis]
+    m = alphap + p * (1 - alphap - betap)
+    n = x.size
+    if n == 0:
+        return np.full(shape=m.shape, fill_value=np.nan)
+    elif n == 1:
+        return np.full(shape=m.shape, fill_value=x[0], dtype=np.float64)
+    aleph = n * p + m
+    k = np.floor(aleph.clip(1, n - 1)).astype(int)
+    gamma = (aleph - k).clip(0, 1)
+    x = np.partition(x, np.union1d(k - 1, k))
+    return (1 - gamma) * x[k - 1] + gamma * x[k]
+
+
+def _plotting_position_rows(methods: tuple[str, ...]) -> list[int]:
+    """
+    Return the rows of _PLOTTING_POSITIONS for the named methods.
+    """
+    try:
+        return [_PLOTTING_POSITION_METHODS.index(method) for method in methods]
+    except ValueError:
+        raise ValueError(
+            f"methods must be in {_PLOTTING_POSITION_METHODS}"
+        ) from None
+
 
 def nonparametric_summary(
     *,
     series: pd.Series,
     alphap: float = 1/3,
     betap: float = 1/3,
-    decimals: int = 3
+    decimals: int = 3,
+    method: str = None
 ) -> pd.Series:
     """
     Calculate empirical quantiles for a series.
@@ -56,6 +141,9 @@ def nonparametric_summary(
         Plotting positions.
     decimals : int = 3
         The number of decimal places for rounding.
+    method : str = None
+        If given, the name of the plotting positions to use instead of
+        alphap and betap, one of the methods of quantiles.
 
     scipy.stats.mstats.mquantiles plotting positions:
         R method 1, SAS method 3:
@@ -112,6 +200,12 @@ def nonparametric_summary(
     ...     betap=0
     ... )
 
+    >>> series = ds.random_data()
+    >>> series = ds.nonparametric_summary(
+    ...     series=series,
+    ...     method="weibull"
+    ... )
+
     Notes
     -----
 
@@ -123,42 +217,46 @@ def nonparametric_summary(
     https://www.jstor.org/stable/2683468.
 
     """
-    xm = np.ma.masked_array(series, mask=np.isnan(series))
-    q25 = mq(xm, prob=(0.25), alphap=alphap, betap=betap)
-    q50 = mq(xm, prob=(0.50), alphap=alphap, betap=betap)
-    q75 = mq(xm, prob=(0.75), alphap=alphap, betap=betap)
+    if method is not None:
+        (row,) = _plotting_position_rows((method,))
+        alphap, betap = _PLOTTING_POSITIONS[row]
+    values = series.to_numpy()
+    data = values[~np.isnan(values)]
+    q25, q50, q75 = _plotting_position_quantiles(
+        x=data, probs=_QUARTILES, alphap=alphap, betap=betap
+    )
+    count = data.size
     iqr = q75 - q25
     lof = (q25 - iqr * 3)
     lif = (q25 - iqr * 1.5)
     uif = (q75 + iqr * 1.5)
     uof = (q75 + iqr * 3)
-    cil = (q50 - 1.57 * iqr / math.sqrt(series.count()))[0]
-    ciu = (q50 + 1.57 * iqr / math.sqrt(series.count()))[0]
+    cil = q50 - 1.57 * iqr / math.sqrt(count)
+    ciu = q50 + 1.57 * iqr / math.sqrt(count)
     return pd.Series({
-        "lower outer fence": round(number=lof[0], ndigits=decimals),
-        "lower inner fence": round(number=lif[0], ndigits=decimals),
-        "lower quartile": round(number=q25[0], ndigits=decimals),
-        "median": round(number=q50[0], ndigits=decimals),
+        "lower outer fence": round(number=lof, ndigits=decimals),
+        "lower inner fence": round(number=lif, ndigits=decimals),
+        "lower quartile": round(number=q25, ndigits=decimals),
+        "median": round(number=q50, ndigits=decimals),
         "confidence interval": (
             round(number=cil, ndigits=decimals),
             round(number=ciu, ndigits=decimals)
         ),
-        "upper quartile": round(number=q75[0], ndigits=decimals),
-        "upper inner fence": round(number=uif[0], ndigits=decimals),
-        "upper outer fence": round(number=uof[0], ndigits=decimals),
-        "interquartile range": round(number=iqr[0], ndigits=decimals),
+        "upper quartile": round(number=q75, ndigits=decimals),
+        "upper inner fence": round(number=uif, ndigits=decimals),
+        "upper outer fence": round(number=uof, ndigits=decimals),
+        "interquartile range": round(number=iqr, ndigits=decimals),
         "inner outliers":
-            [
-                round(number=x, ndigits=decimals)
-                for x in series if x < lif or x > uif],
+            np.round(
+                values[(values < lif) | (values > uif)], decimals=decimals
+            ).tolist(),
         "outer outliers":
-            [
-                round(number=x, ndigits=decimals)
-                for x in series if x < lof or x > uof
-            ],
-        "minimum value": round(number=series.min(), ndigits=decimals),
-        "maximum value": round(number=series.max(), ndigits=decimals),
-        "count": series.count()
+            np.round(
+                values[(values < lof) | (values > uof)], decimals=decimals
+            ).tolist(),
+        "minimum value": round(number=data.min(), ndigits=decimals),
+        "maximum value": round(number=data.max(), ndigits=decimals),
+        "count": count
     })
 
 
@@ -195,28 +293,99 @@ def parametric_summary(
     >>> series = ds.random_data()
     >>> series = ds.parametric_summary(series=series)
     """
-    ciaverage = stats.t.interval(
-            confidence=0.95,
-            df=series.size - 1,
-            loc=series.mean(),
-            scale=series.sem()
-        )
+    data = series.dropna().to_numpy()
+    count = data.size
+    if count == 0:
+        # Every statistic of an empty or all-missing series is NaN.
+        average = variance = standard_deviation = np.nan
+        minimum = maximum = np.nan
+        ciaverage = (np.nan, np.nan)
+    else:
+        average = data.mean()
+        variance = data.var(ddof=1)
+        standard_deviation = math.sqrt(variance)
+        minimum, maximum = data.min(), data.max()
+        ciaverage = stats.t.interval(
+                confidence=0.95,
+                df=series.size - 1,
+                loc=average,
+                scale=standard_deviation / math.sqrt(count)
+            )
     return pd.Series(
         data={
-            "n": series.count(),
-            "min": round(number=series.min(), ndigits=decimals),
-            "max": round(number=series.max(), ndigits=decimals),
-            "ave": round(number=series.mean(), ndigits=decimals),
+            "n": count,
+            "min": round(number=minimum, ndigits=decimals),
+            "max": round(number=maximum, ndigits=decimals),
+            "ave": round(number=average, ndigits=decimals),
             "confidence interval": (
                 round(number=ciaverage[0], ndigits=decimals),
                 round(number=ciaverage[1], ndigits=decimals)
             ),
-            "s": round(number=series.std(), ndigits=decimals),
-            "var": round(number=series.var(), ndigits=decimals),
+            "s": round(number=standard_deviation, ndigits=decimals),
+            "var": round(number=variance, ndigits=decimals),
         }
     )
 
 
+def quantiles(
+    *,
+    series: pd.Series,
+    probs: tuple[float, ...] = (0.25, 0.50, 0.75),
+    methods: tuple[str, ...] = ("median_unbiased",)
+) -> pd.DataFrame:
+    """
+    Calculate empirical quantiles for several probabilities and methods.
+
+    The data are partitioned once for every probability and method.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The input series.
+    probs : tuple[float, ...] = (0.25, 0.50, 0.75)
+        The probabilities of the quantiles.
+    methods : tuple[str, ...] = ("median_unbiased",)
+        The plotting positions (alphap, betap):
+            "interpolated_inverted_cdf": R method 4, SAS method 1 (0, 1)
+            "hazen": R method 5 (0.5, 0.5)
+            "weibull": R method 6, SAS method 4, Minitab, SPSS (0, 0)
+            "linear": R method 7, pandas default (1, 1)
+            "median_unbiased": R method 8 (1/3, 1/3)
+            "normal_unbiased": R method 9 (3/8, 3/8)
+            "cunnane": Cunnane's method, SciPy default (0.4, 0.4)
+            "apl": APL method (0.35, 0.35)
+
+    Returns
+    -------
+    pd.DataFrame
+        The quantiles, one row per method and one column per probability.
+
+    Example
+    -------
+
+    >>> import datasense as ds
+    >>> series = ds.random_data()
+    >>> df = ds.quantiles(
+    ...     series=series,
+    ...     probs=(0.05, 0.50, 0.95),
+    ...     methods=("weibull", "linear")
+    ... )
+    """
+    rows = _plotting_position_rows(methods)
+    values = series.to_numpy(dtype=np.float64)
+    result = _plotting_position_quantiles(
+        x=values[~np.isnan(values)],
+        probs=probs,
+        alphap=_PLOTTING_POSITIONS[rows, 0],
+        betap=_PLOTTING_POSITIONS[rows, 1]
+    )
+    return pd.DataFrame(
+        data=result,
+        index=pd.Index(data=methods, name="method"),
+        columns=probs
+    )
+
+
 def cubic_spline(
     *,
     df: pd.DataFrame,
@@ -336,7 +505,7 @@ def cubic_spline(
 def natural_cubic_spline(
     *,
     X: pd.Series,
-    y: pd.Series,
+    y: pd.Series | pd.DataFrame | np.ndarray,
     number_knots: int,
     list_knots: list[int] = None
 ) -> Pipeline:
@@ -353,8 +522,10 @@ def natural_cubic_spline(
     ----------
     X : pd.Series
         The data series of the abscissa.
-    y : pd.Series
-        The data series of the ordinate.
+    y : pd.Series | pd.DataFrame | np.ndarray
+        The data series of the ordinate. Several series sharing X may be
+        given as columns; they are fitted together and predict returns one
+        column per series.
     number_knots : int
         The number of knots for the spline.
     list_knots : list[int] = None
@@ -2610,5 +2781,6 @@ __all__ = (
     "two_sample_t",
     "one_sample_t",
     "random_data",
+    "quantiles",
     "paired_t",
 )
@@ -10,7 +10,6 @@ setup(
     url="https://github.com/gillespilon/datasense",
     install_requires=[
         "basis_expansions",
-        "cached_property",
         "beautifultable",
         "scikit-learn",
         "statsmodels",
@@ -415,13 +415,44 @@ def test_R_many():
     assert r.sigma == approx(1.010469475)
 
 
-def test_nwise():
-    assert list(cc._nwise([1, 2, 3, 4], 0)) == []
-    assert list(cc._nwise([1, 2, 3, 4], 1)) == [(1,), (2,), (3,), (4,)]
-    assert list(cc._nwise([1, 2, 3, 4], 2)) == [(1, 2), (2, 3), (3, 4)]
-    assert list(cc._nwise([1, 2, 3, 4, 5], 3)) == [(1, 2, 3), (2, 3, 4),
-                                                   (3, 4, 5)]
-    assert list(cc._nwise([1, 2, 3, 4, 5], 5)) == [(1, 2, 3, 4, 5)]
+def test_X_mR_extra_string_column():
+    df = pd.DataFrame({
+        'X': [25.0, 24.0, 35.5, 22.4, 23.1, 13.9, 13.9, 10.0, 13.3, 10.0],
+        'id': ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j'],
+    })
+    for constructor in (cc.X, cc.mR):
+        chart = constructor(data=df)
+        expected = constructor(data=df[['X']])
+        assert chart.mean == approx(expected.mean)
+        assert chart.ucl == approx(expected.ucl)
+        assert chart.lcl == approx(expected.lcl)
+
+
+def test_constants():
+    assert (cc.CONSTANTS.dtypes == float).all()
+    assert cc.CONSTANTS['D3'].loc[2:6].isna().all()
+    assert cc.CONSTANTS['D3'].loc[7] == approx(0.076)
+
+
+def test_sigmas():
+    sigmas = cc.Sigmas(mean=10.0, sigma=2.0)
+    assert sigmas[+3] == approx(16.0)
+    assert sigmas[0] == approx(10.0)
+    assert sigmas[-5] == approx(0.0)
+    assert list(sigmas[-3:4]) == approx([4.0, 6.0, 8.0, 10.0, 12.0, 14.0,
+                                         16.0])
+    assert list(sigmas[:]) == approx(list(sigmas[-3:4]))
+    assert list(sigmas[-2:3:2]) == approx([6.0, 10.0, 14.0])
+    assert list(sigmas[[-2, 2]]) == approx([6.0, 14.0])
+
+
+def test_points_four():
+    # A point on the central line neither extends nor ends a run.
+    df = pd.DataFrame({'X': [1.0] * 7 + [0.5] + [1.0] * 2 + [0.0] * 9})
+    above, below = cc.points_four(cc.X(df))
+    assert cc.X(df).mean == approx(0.5)
+    assert list(above.index) == [8, 9]
+    assert list(below.index) == [17, 18]
 
 
 def test_draw_rules():
@@ -1,4 +1,6 @@
+from pytest import raises
 import datasense as ds
+import pandas as pd
 
 
 def test_plot_scatterleft_scatterright_x_y1_y2():
@@ -66,7 +68,14 @@ def test_plot_scatter_y():
 
 
 def test_plot_line_x_y():
-    pass
+    X = pd.Series([3.0, 1.0, 2.0, 5.0, 4.0, 6.0])
+    y = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    with raises(ValueError):
+        ds.plot_line_x_y(X=X, y=y, max_points=4)
+    with raises(ValueError):
+        ds.plot_line_x_y(X=X.sort_values(), y=y, max_points=3)
+    fig, ax = ds.plot_line_x_y(X=X.sort_values(), y=y, max_points=4)
+    assert ax.lines[0].get_xdata().size <= 4
 
 
 def test_format_dates():
@@ -78,7 +87,11 @@ def test_plot_boxplot():
 
 
 def test_plot_line_y():
-    pass
+    y = pd.Series([1.0, 5.0, 2.0, 4.0, 3.0, 6.0, 0.0, 7.0, 8.0])
+    with raises(ValueError):
+        ds.plot_line_y(y=y, max_points=2)
+    fig, ax = ds.plot_line_y(y=y, max_points=8)
+    assert ax.lines[0].get_xdata().size <= 8
 
 
 def test_plot_pareto():
@@ -0,0 +1,16 @@
+from importlib import import_module
+from pkgutil import iter_modules
+import datasense as ds
+
+
+def test_submodules():
+    """
+    Every submodule, and every name in its __all__, is in the lazy map.
+    """
+    modules = {module.name for module in iter_modules(ds.__path__)}
+    assert set(ds._SUBMODULES) == modules
+    for module, names in ds._SUBMODULES.items():
+        submodule = import_module(f"datasense.{module}")
+        assert names == tuple(submodule.__all__), module
+        for name in names:
+            assert getattr(ds, name) is getattr(submodule, name)
@@ -1,5 +1,6 @@
 import warnings
 
+from scipy.stats.mstats import mquantiles
 import datasense as ds
 import pandas as pd
 import numpy as np
@@ -181,6 +182,52 @@ def test_nonparametric_summary():
     assert result.equals(other=expected)
 
 
+def test_nonparametric_summary_method():
+    result = ds.nonparametric_summary(series=X, method="weibull")
+    expected = ds.nonparametric_summary(series=X, alphap=0, betap=0)
+    assert result.equals(other=expected)
+
+
+def test_plotting_position_quantiles():
+    probs = (0.05, 0.25, 0.50, 0.75, 0.95)
+    alphaps = np.array([0, 0.5, 0, 1, 1 / 3, 0.375, 0.4])
+    betaps = np.array([1, 0.5, 0, 1, 1 / 3, 0.375, 0.4])
+    result = ds.stats._plotting_position_quantiles(
+        x=X.to_numpy(), probs=probs, alphap=alphaps, betap=betaps
+    )
+    expected = np.array([
+        mquantiles(X, prob=probs, alphap=alphap, betap=betap)
+        for alphap, betap in zip(alphaps, betaps)
+    ])
+    assert np.allclose(result, expected)
+
+
+def test_plotting_positions():
+    probs = (0.05, 0.25, 0.50, 0.75, 0.95)
+    result = ds.stats._plotting_position_quantiles(
+        x=X.to_numpy(),
+        probs=probs,
+        alphap=ds.stats._PLOTTING_POSITIONS[:, 0],
+        betap=ds.stats._PLOTTING_POSITIONS[:, 1]
+    )
+    for row, method in zip(result, ds.stats._PLOTTING_POSITION_METHODS[:6]):
+        assert np.allclose(row, np.quantile(X, probs, method=method))
+
+
+def test_quantiles():
+    probs = (0.05, 0.50, 0.95)
+    result = ds.quantiles(
+        series=X, probs=probs, methods=("weibull", "linear")
+    )
+    assert list(result.index) == ["weibull", "linear"]
+    assert np.allclose(
+        result.loc["weibull"], mquantiles(X, prob=probs, alphap=0, betap=0)
+    )
+    assert np.allclose(
+        result.loc["linear"], mquantiles(X, prob=probs, alphap=1, betap=1)
+    )
+
+
 def test_parametric_summary():
     result = ds.parametric_summary(series=X, decimals=3)
     expected = pd.Series(
@@ -197,6 +244,13 @@ def test_parametric_summary():
     assert result.equals(other=expected)
 
 
+def test_parametric_summary_all_nan():
+    result = ds.parametric_summary(series=pd.Series(data=[np.nan] * 5))
+    assert result["n"] == 0
+    assert np.isnan(result["confidence interval"]).all()
+    assert result.drop(labels=["n", "confidence interval"]).isna().all()
+
+
 def test_cubic_spline():
     cubic_spline = ds.cubic_spline(
         df=df_integer_float, abscissa="abscissa", ordinate="ordinate"